@@ -12,133 +12,138 @@ trusted sources when mentioning factual details about Writesonic or
 Botsonic. Generic observations about competitor tools remain high‑level
 and do not make unsupported claims.
 
+The competitors covered by the "Writesonic vs" posts are listed in
+`competitors.json` next to this script.
+
 Running this script will add new files in the `posts/` directory. It
 does not overwrite existing posts; if a file already exists, it is
-skipped to prevent accidental data loss.
+skipped to prevent accidental data loss. Pass ``--archive PATH`` to
+bundle the new posts into a single tar file instead.
 """
 
 from __future__ import annotations
+import argparse
+import functools
+import io
+import json
 import os
+import string
+import sys
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, NamedTuple
 
 # Base directory for the website
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # Directory where new posts will be stored
 POSTS_DIR = os.path.join(BASE_DIR, "posts")
+# Flags for creating post files; O_BINARY stops newline translation on Windows
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+# Most buffers a single os.writev call accepts
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 16  # POSIX minimum
+if IOV_MAX <= 0:
+    IOV_MAX = 16
+# Scratch buffers used to assemble a post where os.writev is unavailable.
+# Each writer thread reuses its own, dropping it if it grows past the limit.
+SCRATCH_BUFFERS = threading.local()
+SCRATCH_BUFFER_LIMIT = 128 * 1024
 
+# Navigation links shared across posts
+NAV_LINKS = (
+    '      <a href="/index.html">Home</a>'
+    '          <a href="/ai-writing-tools.html">AI Writing Tools</a>'
+    '          <a href="/writesonic-review.html">Writesonic Review</a>'
+    '          <a href="/writesonic-vs.html">Writesonic vs Others</a>'
+    '          <a href="/ai-content-generator.html">Content Generators</a>'
+)
+# Site header and footer; identical on every post
+HEADER_HTML = "\n".join([
+    "    <header class=\"navbar\">",
+    "      <div class=\"container\">",
+    "        <div class=\"logo\">AI Writer Hub</div>",
+    "        <nav>",
+    NAV_LINKS,
+    "        </nav>",
+    "      </div>",
+    "    </header>",
+])
+FOOTER_HTML = "    <footer class=\"footer\"><div class=\"container\"><p>© 2025 AI Writer Hub.</p></div></footer>"
 
-def ensure_directory(path: str) -> None:
-    """Ensure that a directory exists."""
-    if not os.path.isdir(path):
-        os.makedirs(path, exist_ok=True)
+# HTML scaffold shared by every post, with ``str.format``-style fields. It is
+# built once at import time; the inputs are trusted HTML, so no escaping is
+# applied.
+POST_TEMPLATE = "\n".join([
+    "<!DOCTYPE html>",
+    "<html lang=\"en\">",
+    "  <head>",
+    "    <meta charset=\"UTF-8\" />",
+    "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />",
+    "    <title>{title}</title>",
+    "    <meta name=\"description\" content=\"{description}\" />",
+    "    <link rel=\"stylesheet\" href=\"/style.css\" />",
+    "  </head>",
+    "  <body>",
+    HEADER_HTML,
+    "    <section class=\"container hero\" style=\"padding-bottom:2rem\">",
+    "      <div class=\"hero-content\">",
+    "        <h1>{hero_heading}</h1>",
+    "        <p>{intro}</p>",
+    "        <a class=\"cta-button\" href=\"https://writesonic.com/botsonic?fpr=frank67\" target=\"_blank\">Try Writesonic</a>",
+    "      </div>",
+    "      <div class=\"hero-image\">",
+    "        <img src=\"/images/article-default.png\" alt=\"Hero image\" />",
+    "      </div>",
+    "    </section>",
+    "    <section class=\"container\">",
+    "{sections_html}",
+    "      <h2>Conclusion</h2>",
+    "      <p>{conclusion}</p>",
+    "      <a class=\"cta-button\" href=\"https://writesonic.com/botsonic?fpr=frank67\" target=\"_blank\">Get Started</a>",
+    "    </section>",
+    FOOTER_HTML,
+    "  </body>",
+    "</html>",
+])
+# Markup for one (heading, content) section, applied with ``%``
+SECTION_FORMAT = "      <h2>%s</h2>\n      <p>%s</p>"
+# POST_TEMPLATE split into (static text, field name) pairs with the static
+# text pre-encoded to UTF-8, so only the per-post values are encoded on
+# each render. The final pair has no field.
+TEMPLATE_PARTS: tuple[tuple[bytes, str | None], ...] = tuple(
+    (literal.encode("utf-8"), field)
+    for literal, field, _, _ in string.Formatter().parse(POST_TEMPLATE)
+)
 
 
-def write_post(filename: str, title: str, description: str, hero_heading: str,
-               intro: str, sections: list[tuple[str, str]], conclusion: str) -> None:
-    """Write a single HTML post to the posts directory.
+class Post(NamedTuple):
+    """Content for a single post, in the order ``write_post`` expects."""
 
-    Parameters
-    ----------
     filename: str
-        The file name (with .html extension) relative to POSTS_DIR.
     title: str
-        The page title used in the <title> element.
     description: str
-        A concise meta description for SEO.
     hero_heading: str
-        The H1 heading displayed in the hero section.
     intro: str
-        A short paragraph introducing the topic.
-    sections: list of (heading, content)
-        Sections of the article with headings and text. The content may
-        include HTML markup (e.g., lists, paragraphs). Citations should be
-        embedded inline using the tether IDs from prior research.
+    sections: tuple[tuple[str, str], ...]
     conclusion: str
-        Final paragraph encouraging the reader to take action.
-    """
-    path = os.path.join(POSTS_DIR, filename)
-    # Do not overwrite existing files
-    if os.path.exists(path):
-        print(f"Skipping existing file: {filename}")
-        return
-    # Navigation links shared across posts
-    nav_links = (
-        '      <a href="/index.html">Home</a>'
-        '          <a href="/ai-writing-tools.html">AI Writing Tools</a>'
-        '          <a href="/writesonic-review.html">Writesonic Review</a>'
-        '          <a href="/writesonic-vs.html">Writesonic vs Others</a>'
-        '          <a href="/ai-content-generator.html">Content Generators</a>'
-    )
-    # Start building the HTML string
-    html_parts = [
-        "<!DOCTYPE html>",
-        "<html lang=\"en\">",
-        "  <head>",
-        "    <meta charset=\"UTF-8\" />",
-        "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />",
-        f"    <title>{title}</title>",
-        f"    <meta name=\"description\" content=\"{description}\" />",
-        "    <link rel=\"stylesheet\" href=\"/style.css\" />",
-        "  </head>",
-        "  <body>",
-        "    <header class=\"navbar\">",
-        "      <div class=\"container\">",
-        "        <div class=\"logo\">AI Writer Hub</div>",
-        "        <nav>",
-        nav_links,
-        "        </nav>",
-        "      </div>",
-        "    </header>",
-        "    <section class=\"container hero\" style=\"padding-bottom:2rem\">",
-        "      <div class=\"hero-content\">",
-        f"        <h1>{hero_heading}</h1>",
-        f"        <p>{intro}</p>",
-        "        <a class=\"cta-button\" href=\"https://writesonic.com/botsonic?fpr=frank67\" target=\"_blank\">Try Writesonic</a>",
-        "      </div>",
-        "      <div class=\"hero-image\">",
-        "        <img src=\"/images/article-default.png\" alt=\"Hero image\" />",
-        "      </div>",
-        "    </section>",
-        "    <section class=\"container\">",
-    ]
-    # Append sections
-    for heading, content in sections:
-        html_parts.append(f"      <h2>{heading}</h2>")
-        html_parts.append(f"      <p>{content}</p>")
-    # Conclusion and CTA
-    html_parts.append("      <h2>Conclusion</h2>")
-    html_parts.append(f"      <p>{conclusion}</p>")
-    html_parts.append(
-        "      <a class=\"cta-button\" href=\"https://writesonic.com/botsonic?fpr=frank67\" target=\"_blank\">Get Started</a>"
-    )
-    # Close section and footer
-    html_parts.extend([
-        "    </section>",
-        "    <footer class=\"footer\"><div class=\"container\"><p>© 2025 AI Writer Hub.</p></div></footer>",
-        "  </body>",
-        "</html>",
-    ])
-    # Write out the file
-    ensure_directory(POSTS_DIR)
-    with open(path, "w", encoding="utf-8") as fp:
-        fp.write("\n".join(html_parts))
-    print(f"Created {filename}")
-
-
-def main() -> None:
-    """Generate a set of articles for the AI Writer Hub website."""
-    ensure_directory(POSTS_DIR)
-    posts: list[dict] = []
-    # General topic posts
-    posts.append({
-        "filename": "best-ai-writer.html",
-        "title": "Best AI Writer Tools – Top Picks for 2025",
-        "description": "Explore the leading AI writing tools of 2025 and discover why Writesonic stands out.",
-        "hero_heading": "Best AI Writer Tools in 2025",
-        "intro": (
+
+
+# General topic posts
+GENERAL_POSTS: tuple[Post, ...] = (
+    Post(
+        filename="best-ai-writer.html",
+        title="Best AI Writer Tools – Top Picks for 2025",
+        description="Explore the leading AI writing tools of 2025 and discover why Writesonic stands out.",
+        hero_heading="Best AI Writer Tools in 2025",
+        intro=(
             "Artificial intelligence has revolutionised content creation. The market is flooded with AI writers, "
             "each promising to generate high‑quality copy in seconds. But which tools are worth your time? We break "
             "down the top options and explain why Writesonic is our favourite."),
-        "sections": [
+        sections=(
             ("Top AI Writers Compared", (
                 "Leading AI writers in 2025 include Outrank, Jasper AI, Surfer AI, Frase AI, Copy.ai, Writesonic, "
                 "ContentBot (formerly ContentKing) and MarketMuse【317782163202915†L70-L75】. These tools use natural language models to generate "
@@ -155,22 +160,22 @@ def main() -> None:
                 "Beyond article writing, Writesonic integrates real‑time SEO data sources like Ahrefs and Google Search Console" 
                 "【39824570645077†L168-L186】 and supports multiple AI models including GPT‑4o, Claude and Gemini【39824570645077†L139-L173】. "
                 "This versatility makes it an ideal choice for content marketers, agencies and small businesses seeking to scale content production."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "While many AI writers offer useful features, none match Writesonic’s combination of long‑form drafting, built‑in "
             "SEO optimisation and multi‑model support. Try it today to see how it can transform your content marketing.")
-    })
-
-    posts.append({
-        "filename": "best-writing-tool.html",
-        "title": "Best Writing Tools for Marketers and Bloggers",
-        "description": "Find the most powerful writing tools to streamline your workflow and produce quality content.",
-        "hero_heading": "Best Writing Tools for Content Creators",
-        "intro": (
+    ),
+
+    Post(
+        filename="best-writing-tool.html",
+        title="Best Writing Tools for Marketers and Bloggers",
+        description="Find the most powerful writing tools to streamline your workflow and produce quality content.",
+        hero_heading="Best Writing Tools for Content Creators",
+        intro=(
             "Whether you’re drafting blog posts, social media captions or product descriptions, the right tools can save "
             "time and improve quality. This guide explores the most effective writing software available and how "
             "Writesonic compares."),
-        "sections": [
+        sections=(
             ("Essential Features of Modern Writing Tools", (
                 "Modern writing tools should do more than correct grammar. They need to understand context, generate "
                 "ideas and optimise for search. Writesonic combines an AI Article Writer, SEO Checker and real‑time research "
@@ -184,21 +189,21 @@ def main() -> None:
                 "Consider your goals—whether you need quick social posts or long‑form articles. If you want comprehensive features "
                 "with a generous free tier, Writesonic offers plans starting from a free option to business subscriptions【879106096187632†L146-L166】【39824570645077†L139-L152】."
             ))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "For marketers and bloggers seeking a single tool that handles research, writing and optimisation, Writesonic is hard to beat. "
             "Its combination of AI models and integrated SEO make it a smart investment for any content strategy.")
-    })
-
-    posts.append({
-        "filename": "best-article-writer.html",
-        "title": "Best Article Writer – Create SEO‑Optimised Posts Fast",
-        "description": "Discover the best article writer tools for producing long‑form, SEO‑friendly blog posts.",
-        "hero_heading": "Best Article Writer Tools",
-        "intro": (
+    ),
+
+    Post(
+        filename="best-article-writer.html",
+        title="Best Article Writer – Create SEO‑Optimised Posts Fast",
+        description="Discover the best article writer tools for producing long‑form, SEO‑friendly blog posts.",
+        hero_heading="Best Article Writer Tools",
+        intro=(
             "Long‑form articles remain one of the most effective ways to drive organic traffic. We evaluate leading article "
             "writers and explain how Writesonic’s Article Writer 6.0 streamlines the drafting process."),
-        "sections": [
+        sections=(
             ("Why Articles Still Matter", (
                 "Despite the rise of short‑form content, comprehensive articles provide depth and build authority. AI tools can "
                 "now generate outlines, headings and full drafts. Writesonic’s Article Writer 6.0 guides users through topic research, "
@@ -211,21 +216,21 @@ def main() -> None:
                 "Beyond text generation, Writesonic provides internal linking suggestions, tone control and multilingual support. "
                 "The built‑in SEO Checker identifies gaps in headings and semantic coverage, then recommends improvements【39824570645077†L254-L265】. "
                 "These features help your articles rank higher without needing separate SEO software."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "If you’re serious about producing high‑quality blog posts quickly, Writesonic offers a complete solution—from research and "
             "drafting to optimisation and publishing. Try the free plan to experience the difference.")
-    })
-
-    posts.append({
-        "filename": "ai-writer-free.html",
-        "title": "Free AI Writer Tools – Top Options for Budget Creators",
-        "description": "Learn about free AI writer tools and why Writesonic’s free plan is one of the most generous available.",
-        "hero_heading": "Top Free AI Writer Options",
-        "intro": (
+    ),
+
+    Post(
+        filename="ai-writer-free.html",
+        title="Free AI Writer Tools – Top Options for Budget Creators",
+        description="Learn about free AI writer tools and why Writesonic’s free plan is one of the most generous available.",
+        hero_heading="Top Free AI Writer Options",
+        intro=(
             "Not every project has the budget for premium software. Luckily, several AI writing tools offer free tiers. Here’s a look at "
             "the best free options and why Writesonic’s free plan is worth considering."),
-        "sections": [
+        sections=(
             ("Free Plans Compared", (
                 "Writesonic provides a free plan that lets users generate up to 10,000 words per month【879106096187632†L146-L166】. This allocation is "
                 "sufficient for testing long‑form capabilities, SEO tools and various templates. Other AI writers like Rytr and Simplified also "
@@ -237,21 +242,21 @@ def main() -> None:
             ("When to Upgrade", (
                 "As your content needs grow, consider upgrading to a paid plan. Writesonic offers Unlimited and Business plans with higher word "
                 "limits and access to GPT‑4 models【879106096187632†L146-L166】【39824570645077†L148-L152】. Upgrading unlocks advanced features while keeping costs reasonable."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "If you’re on a budget, start with Writesonic’s free tier to explore its features. As you scale your content, you can upgrade to "
             "unlock more credits and advanced models without switching platforms.")
-    })
-
-    posts.append({
-        "filename": "writesonic-pricing.html",
-        "title": "Writesonic Pricing – Plans & What You Get",
-        "description": "Understand Writesonic’s pricing tiers and decide which plan fits your needs.",
-        "hero_heading": "Writesonic Pricing Explained",
-        "intro": (
+    ),
+
+    Post(
+        filename="writesonic-pricing.html",
+        title="Writesonic Pricing – Plans & What You Get",
+        description="Understand Writesonic’s pricing tiers and decide which plan fits your needs.",
+        hero_heading="Writesonic Pricing Explained",
+        intro=(
             "Budget considerations are important when choosing a writing platform. Writesonic offers multiple plans from a generous free tier to "
             "enterprise packages. Here’s a breakdown to help you choose."),
-        "sections": [
+        sections=(
             ("Free and Starter Plans", (
                 "Writesonic’s free plan includes up to 10k words per month【879106096187632†L146-L166】. It gives access to most templates, including the "
                 "AI Article Writer and SEO Checker. The Starter plan (often called Unlimited) starts around $16 per month and provides unlimited words "
@@ -264,21 +269,21 @@ def main() -> None:
                 "According to a 2025 review, Writesonic’s pricing ranges from about $20 per month for basic plans to $499 per month for advanced business tiers, "
                 "depending on usage and feature requirements【39824570645077†L139-L152】. Regardless of plan, all tiers include access to more than 80 writing, "
                 "editing and optimisation tools【39824570645077†L139-L169】."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "Choose a plan based on your content volume and need for advanced models. Writesonic’s flexible pricing means you can start small and upgrade as "
             "your business grows.")
-    })
-
-    posts.append({
-        "filename": "writesonic-free-trial.html",
-        "title": "Writesonic Free Trial – How to Get Started",
-        "description": "Learn how to sign up for Writesonic’s free plan and what features are included.",
-        "hero_heading": "How to Use Writesonic for Free",
-        "intro": (
+    ),
+
+    Post(
+        filename="writesonic-free-trial.html",
+        title="Writesonic Free Trial – How to Get Started",
+        description="Learn how to sign up for Writesonic’s free plan and what features are included.",
+        hero_heading="How to Use Writesonic for Free",
+        intro=(
             "Interested in testing Writesonic without a commitment? The platform offers a free tier with generous allowances. This guide walks you through "
             "signing up and making the most of your trial."),
-        "sections": [
+        sections=(
             ("Signing Up", (
                 "Creating a Writesonic account is straightforward: visit the website, choose the free plan and verify your email. You’ll immediately access "
                 "core tools like the Article Writer and SEO Checker.")),
@@ -288,20 +293,20 @@ def main() -> None:
             ("When to Upgrade", (
                 "Once you exceed the free tier’s limits, upgrading to the Unlimited or Business plan grants more credits and access to GPT‑4 models for higher "
                 "quality content【879106096187632†L146-L166】."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "A free Writesonic account is the perfect way to experience AI‑powered writing. Start today and see how AI can streamline your content creation.")
-    })
-
-    posts.append({
-        "filename": "writesonic-alternatives.html",
-        "title": "Writesonic Alternatives – Top Competitors Compared",
-        "description": "Explore the top alternatives to Writesonic and see how they compare on features, price and ease of use.",
-        "hero_heading": "Top Writesonic Alternatives",
-        "intro": (
+    ),
+
+    Post(
+        filename="writesonic-alternatives.html",
+        title="Writesonic Alternatives – Top Competitors Compared",
+        description="Explore the top alternatives to Writesonic and see how they compare on features, price and ease of use.",
+        hero_heading="Top Writesonic Alternatives",
+        intro=(
             "While Writesonic offers a comprehensive suite of tools, you might be curious about other options. This article compares leading alternatives "
             "to help you decide which AI writer fits your workflow."),
-        "sections": [
+        sections=(
             ("Jasper AI", (
                 "Jasper AI is known for its long‑form assistant and extensive template library【317782163202915†L152-L176】. It integrates with Surfer SEO "
                 "for real‑time optimisation【317782163202915†L181-L187】. However, its higher price point may deter some users【317782163202915†L198-L204】.")),
@@ -314,21 +319,21 @@ def main() -> None:
             ("Why Choose Writesonic", (
                 "Writesonic combines long‑form generation, SEO analysis and integration with multiple AI models【39824570645077†L139-L170】. It offers flexible pricing and "
                 "a generous free tier【879106096187632†L146-L166】, making it a strong option for most users."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "Many tools compete in the AI writing space, but Writesonic’s mix of features, value and ease of use continues to set it apart. Try it yourself "
             "to see why it’s our top recommendation.")
-    })
-
-    posts.append({
-        "filename": "writesonic-affiliate-program.html",
-        "title": "Writesonic Affiliate Program – Earn by Sharing AI Tools",
-        "description": "Learn about Writesonic’s affiliate program and how you can earn commissions promoting its AI writing platform.",
-        "hero_heading": "Make Money with Writesonic’s Affiliate Program",
-        "intro": (
+    ),
+
+    Post(
+        filename="writesonic-affiliate-program.html",
+        title="Writesonic Affiliate Program – Earn by Sharing AI Tools",
+        description="Learn about Writesonic’s affiliate program and how you can earn commissions promoting its AI writing platform.",
+        hero_heading="Make Money with Writesonic’s Affiliate Program",
+        intro=(
             "If you love using Writesonic, you can also earn income by sharing it. Writesonic offers an affiliate program where partners earn a commission "
             "for each referral that converts."),
-        "sections": [
+        sections=(
             ("How the Program Works", (
                 "After signing up for the affiliate program, you’ll receive a unique referral link (like the one used throughout this site). Whenever someone "
                 "clicks your link and purchases a plan, you earn a commission. Commissions are typically a percentage of the sale and may vary by plan.")),
@@ -338,20 +343,20 @@ def main() -> None:
             ("Tips for Success", (
                 "Focus on creating high‑quality content that solves problems for your readers. Use SEO‑friendly keywords like ‘best AI writer’ and provide "
                 "clear calls to action. Include honest reviews and comparisons to build trust."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "Joining the Writesonic affiliate program is a win‑win: your readers discover a powerful writing tool, and you earn commissions. Sign up and start "
             "promoting Writesonic today.")
-    })
-
-    posts.append({
-        "filename": "writesonic-tutorial.html",
-        "title": "Writesonic Tutorial – Step‑By‑Step Guide for Beginners",
-        "description": "A beginner’s guide to using Writesonic to create blog posts, ads and SEO content.",
-        "hero_heading": "How to Use Writesonic",
-        "intro": (
+    ),
+
+    Post(
+        filename="writesonic-tutorial.html",
+        title="Writesonic Tutorial – Step‑By‑Step Guide for Beginners",
+        description="A beginner’s guide to using Writesonic to create blog posts, ads and SEO content.",
+        hero_heading="How to Use Writesonic",
+        intro=(
             "New to Writesonic? This tutorial walks you through the platform so you can start generating high‑quality content today."),
-        "sections": [
+        sections=(
             ("Step 1 – Create an Account", (
                 "Visit Writesonic’s website and sign up for the free plan. Verify your email to access the dashboard.")),
             ("Step 2 – Choose a Template", (
@@ -363,20 +368,20 @@ def main() -> None:
             ("Step 5 – Publish", (
                 "Once satisfied, copy the content into your CMS or export it directly. Writesonic integrates with platforms like WordPress and social media "
                 "for quick publishing【39824570645077†L182-L186】."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "With Writesonic, you can go from idea to published article in minutes. Follow this workflow to produce high‑quality content that ranks.")
-    })
-
-    posts.append({
-        "filename": "botsonic-review.html",
-        "title": "Botsonic Review – Build Custom AI Chatbots Without Coding",
-        "description": "Explore Botsonic’s features, pros and pricing to see if it’s the right AI chatbot builder for your business.",
-        "hero_heading": "Botsonic Review",
-        "intro": (
+    ),
+
+    Post(
+        filename="botsonic-review.html",
+        title="Botsonic Review – Build Custom AI Chatbots Without Coding",
+        description="Explore Botsonic’s features, pros and pricing to see if it’s the right AI chatbot builder for your business.",
+        hero_heading="Botsonic Review",
+        intro=(
             "Botsonic is Writesonic’s no‑code chatbot builder. It lets businesses deploy custom AI assistants on their websites with minimal effort. "
             "In this review, we explore its core features and pricing."),
-        "sections": [
+        sections=(
             ("What Is Botsonic?", (
                 "Botsonic allows businesses to create conversational AI chatbots without writing code. It uses a combination of proprietary and OpenAI models "
                 "to understand user intent, answer questions and complete tasks automatically【71157615675290†L142-L155】.")),
@@ -392,20 +397,20 @@ def main() -> None:
             ("Pricing", (
                 "Botsonic offers a free tier with 100 messages, one user and 500k characters of training data【71157615675290†L281-L283】. The Starter plan costs around $49 per month "
                 "for 2,000 messages and more users, while Business plans scale with usage【71157615675290†L281-L289】."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "Botsonic provides an accessible way to build AI chatbots without coding. Its customisation options and analytics make it ideal for businesses "
             "seeking to automate support and lead generation. Sign up through Writesonic to get started.")
-    })
-
-    posts.append({
-        "filename": "botsonic-pricing.html",
-        "title": "Botsonic Pricing – Plans for Every Business",
-        "description": "Compare Botsonic’s free and paid plans to find the right fit for your AI chatbot needs.",
-        "hero_heading": "Botsonic Pricing Explained",
-        "intro": (
+    ),
+
+    Post(
+        filename="botsonic-pricing.html",
+        title="Botsonic Pricing – Plans for Every Business",
+        description="Compare Botsonic’s free and paid plans to find the right fit for your AI chatbot needs.",
+        hero_heading="Botsonic Pricing Explained",
+        intro=(
             "Understanding Botsonic’s pricing helps you plan your chatbot deployment. The platform offers tiers that scale with your message volume."),
-        "sections": [
+        sections=(
             ("Free Plan", (
                 "Botsonic’s free plan includes 100 monthly messages, a single user and one trainable chatbot【71157615675290†L281-L283】. You can train up to 500,000 characters of "
                 "data, which is sufficient for basic customer support.")),
@@ -415,19 +420,19 @@ def main() -> None:
             ("Business Plan", (
                 "Botsonic’s Business plan has variable pricing that scales with message volume and number of users【71157615675290†L285-L289】. You’ll need to contact sales for a "
                 "custom quote."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "Start with the free plan to evaluate Botsonic. As your traffic increases, upgrade to a paid tier that matches your message volume.")
-    })
-
-    posts.append({
-        "filename": "botsonic-vs-other-chatbots.html",
-        "title": "Botsonic vs Other Chatbot Builders – Which Should You Choose?",
-        "description": "Compare Botsonic with typical chatbot platforms to see which tool delivers the best customer experience.",
-        "hero_heading": "Botsonic vs Other Chatbots",
-        "intro": (
+    ),
+
+    Post(
+        filename="botsonic-vs-other-chatbots.html",
+        title="Botsonic vs Other Chatbot Builders – Which Should You Choose?",
+        description="Compare Botsonic with typical chatbot platforms to see which tool delivers the best customer experience.",
+        hero_heading="Botsonic vs Other Chatbots",
+        intro=(
             "Businesses have many options for creating chatbots, from Intercom and Drift to custom solutions. Here’s how Botsonic stacks up."),
-        "sections": [
+        sections=(
             ("Traditional Chatbot Platforms", (
                 "Intercom and Drift offer customer support chatbots with basic automation and CRM integrations. However, they often require coding or "
                 "complex setup.")),
@@ -437,79 +442,23 @@ def main() -> None:
             ("When to Choose Another Tool", (
                 "If you need extensive CRM or helpdesk integrations, a platform like Intercom may be more appropriate. But for most businesses seeking "
                 "an easy‑to‑deploy AI chatbot, Botsonic is often the more accessible choice."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "Botsonic bridges the gap between complicated enterprise chatbots and simplistic forms. Try it via Writesonic to see how it can improve your "
             "customer interactions.")
-    })
+    ),
+)
 
-    # Competitor comparison posts
-    competitors = [
-        ("Ink for All", "ink-for-all", "Ink for All offers on‑page SEO and grammar suggestions but its content generation is limited. It lacks long‑form drafting and multi‑model support."),
-        ("WordHero", "wordhero", "WordHero provides blog outlines and marketing copy templates but doesn’t include a native SEO module or deep long‑form capabilities."),
-        ("Rytr", "rytr", "Rytr is an affordable tool for short copy and emails, yet it caps word counts and has fewer templates than Writesonic."),
-        ("ContentBot", "contentbot", "ContentBot (formerly ContentKing) focuses on on‑page optimisation and idea generation rather than full article creation."),
-        ("Writecream", "writecream", "Writecream is tailored for cold outreach and personalised emails; it’s not built for comprehensive blog posts or SEO."),
-        ("ClosersCopy", "closerscopy", "ClosersCopy specialises in conversion‑focused copywriting for sales pages but offers limited SEO insights."),
-        ("Simplified", "simplified", "Simplified is an all‑in‑one design and copy platform that creates social posts and basic ads but lacks advanced SEO features."),
-        ("WriterZen", "writerzen", "WriterZen emphasises keyword clustering and topic research rather than generating finished content."),
-        ("NeuronWriter", "neuronwriter", "NeuronWriter provides on‑page optimisation recommendations, not full article generation."),
-        ("Content at Scale", "content-at-scale", "Content at Scale automatically produces long articles but comes at a higher price and doesn’t integrate multiple AI models."),
-        ("WordAI", "wordai", "WordAI rewrites existing text using synonyms. It isn’t a creative writer and lacks SEO features."),
-        ("Hypotenuse AI", "hypotenuse", "Hypotenuse AI excels at product descriptions and eCommerce copy but doesn’t offer robust long‑form blogging tools."),
-        ("LongShot AI", "longshot", "LongShot AI focuses on researching and drafting long‑form content but can be slow and doesn’t include built‑in SEO optimisation."),
-        ("Sassbook", "sassbook", "Sassbook is a general AI writer with basic features and no integrated SEO checker."),
-        ("Speedwrite", "speedwrite", "Speedwrite is primarily a paraphrasing tool that rewrites existing text rather than generating new articles."),
-        ("Scribble AI", "scribble-ai", "Scribble AI focuses on creative story writing and idea generation rather than structured blog posts and SEO.")
-        # Additional competitors added for more variety
-        ,
-        ("Google Bard", "bard", "Google Bard (now integrated into Gemini) offers conversational answers and basic text generation but lacks dedicated long‑form writing workflows and SEO tools."),
-        ("Article Forge", "article-forge", "Article Forge automatically generates full articles but provides limited control over tone or SEO and can produce generic output."),
-        ("Koala Writer", "koala-writer", "Koala Writer is an AI article generator popular for Amazon affiliates; however, it offers fewer templates and lacks integrated SEO optimisation compared to Writesonic.")
-    ]
-    for name, slug, summary in competitors:
-        filename = f"writesonic-vs-{slug}.html"
-        title = f"Writesonic vs {name} – Which AI Writer Wins?"
-        description = f"Compare Writesonic and {name} to decide which AI writing tool offers the best features and value."
-        hero_heading = f"Writesonic vs {name}"
-        intro_text = (
-            f"{name} is a notable player in the AI writing space. In this article, we compare its strengths and weaknesses "
-            f"to Writesonic’s versatile platform."
-        )
-        sections_list = [
-            (f"{name} Overview", summary),
-            ("Writesonic Overview", (
-                "Writesonic combines long‑form generation with an SEO Checker &amp; Optimizer that analyses keyword coverage and headings in real time" 
-                "【508602464543840†L86-L130】【39824570645077†L254-L265】. It integrates with multiple AI models and offers over 80 tools for writing, research and editing" 
-                "【39824570645077†L139-L169】. Its pricing is flexible, with a generous free tier and affordable paid plans【879106096187632†L146-L166】.")),
-            ("Which Should You Choose?", (
-                f"If you need {name.lower()}’s niche capabilities, it may serve a specific purpose. However, for a complete writing and SEO solution, "
-                "Writesonic delivers more functionality and value. The built‑in article writer and optimisation tools make it ideal for bloggers, marketers "
-                "and entrepreneurs."))
-        ]
-        conclusion_text = (
-            f"{name} has its merits, but Writesonic’s comprehensive suite of tools makes it the better option for most users. Sign up today to experience "
-            "AI‑powered writing with SEO built in."
-        )
-        posts.append({
-            "filename": filename,
-            "title": title,
-            "description": description,
-            "hero_heading": hero_heading,
-            "intro": intro_text,
-            "sections": sections_list,
-            "conclusion": conclusion_text
-        })
-
-    # Additional general posts
-    posts.append({
-        "filename": "best-ai-copywriting-tools.html",
-        "title": "Best AI Copywriting Tools – Boost Your Marketing",
-        "description": "Discover the most effective AI copywriting tools and why Writesonic tops our list.",
-        "hero_heading": "Top AI Copywriting Tools",
-        "intro": (
+# Additional general posts, listed after the competitor comparisons
+ADDITIONAL_POSTS: tuple[Post, ...] = (
+    Post(
+        filename="best-ai-copywriting-tools.html",
+        title="Best AI Copywriting Tools – Boost Your Marketing",
+        description="Discover the most effective AI copywriting tools and why Writesonic tops our list.",
+        hero_heading="Top AI Copywriting Tools",
+        intro=(
             "AI copywriting tools can turbocharge your marketing by generating headlines, ads and social posts in seconds. We highlight the best options and why Writesonic stands out."),
-        "sections": [
+        sections=(
             ("Leading Copywriting Platforms", (
                 "Popular copywriting tools include Copy.ai, Jasper AI and Writesonic. Copy.ai excels at short‑form marketing text, while Jasper provides long‑form "
                 "drafts at a higher price. Writesonic delivers both types of content along with SEO optimisation【39824570645077†L139-L152】.")),
@@ -518,57 +467,57 @@ def main() -> None:
                 "your copy is search‑friendly【39824570645077†L254-L265】.")),
             ("Why Writesonic Leads", (
                 "With over 80 tools for content creation and integration with multiple AI models【39824570645077†L139-L169】, Writesonic is a versatile choice for marketers."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "For a copywriting tool that balances short‑form creativity with long‑form power and SEO insights, Writesonic is our top pick.")
-    })
-
-    posts.append({
-        "filename": "best-ai-content-generators.html",
-        "title": "Best AI Content Generators – Craft Articles and More",
-        "description": "A comparison of leading AI content generators and why Writesonic is an excellent choice for 2025.",
-        "hero_heading": "Best AI Content Generators",
-        "intro": (
+    ),
+
+    Post(
+        filename="best-ai-content-generators.html",
+        title="Best AI Content Generators – Craft Articles and More",
+        description="A comparison of leading AI content generators and why Writesonic is an excellent choice for 2025.",
+        hero_heading="Best AI Content Generators",
+        intro=(
             "Content generators use advanced language models to produce blogs, scripts and marketing materials. This guide reviews the top tools and explains why Writesonic is a front‑runner."),
-        "sections": [
+        sections=(
             ("How Content Generators Work", (
                 "AI content generators analyse your input, research similar topics and compose human‑like text. Writesonic’s AI Article Writer streamlines this process with step‑by‑step prompts and keyword selection【39824570645077†L231-L249】.")),
             ("Comparing Platforms", (
                 "Surfer AI digs into SERP results to build outlines【317782163202915†L240-L258】, while Jasper offers a guided long‑form assistant【317782163202915†L152-L170】. Writesonic blends these capabilities with real‑time SEO data to deliver well‑optimised drafts【39824570645077†L254-L265】.")),
             ("Making Your Choice", (
                 "Choose a generator that matches your budget and feature needs. Writesonic’s free plan lets you test its capabilities before committing to a paid tier【879106096187632†L146-L166】."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "When weighing content generators, consider the balance of writing quality, SEO integration and cost. Writesonic offers an impressive combination of all three.")
-    })
-
-    posts.append({
-        "filename": "best-free-ai-writing-tools.html",
-        "title": "Best Free AI Writing Tools – Get Started Without Spending",
-        "description": "Explore free AI writing tools and see why Writesonic’s free tier provides exceptional value.",
-        "hero_heading": "Top Free AI Writing Tools",
-        "intro": (
+    ),
+
+    Post(
+        filename="best-free-ai-writing-tools.html",
+        title="Best Free AI Writing Tools – Get Started Without Spending",
+        description="Explore free AI writing tools and see why Writesonic’s free tier provides exceptional value.",
+        hero_heading="Top Free AI Writing Tools",
+        intro=(
             "Many AI writing tools offer free plans to help you try before you buy. We compare the best options and highlight what you get with Writesonic’s free tier."),
-        "sections": [
+        sections=(
             ("Top Free Options", (
                 "Free tools include Writesonic, Rytr and Simplified. Writesonic’s free plan offers up to 10k words per month and access to core features like the Article Writer and SEO Checker【879106096187632†L146-L166】.")),
             ("Feature Comparisons", (
                 "While other free tools restrict templates or remove SEO analysis, Writesonic’s free tier maintains most functionality. This allows you to generate blog posts, ads and social media content without upgrades.")),
             ("Upgrading for More", (
                 "As your needs grow, upgrading to a paid plan unlocks more credits and advanced models【879106096187632†L146-L166】. Writesonic’s Unlimited and Business plans remain affordable compared to competitors."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "If you want to experiment with AI writing without spending, Writesonic’s free plan is one of the best ways to begin.")
-    })
-
-    posts.append({
-        "filename": "how-do-ai-writers-work.html",
-        "title": "How Do AI Writers Work?",
-        "description": "An explanation of the technology behind AI writing tools and what makes them effective.",
-        "hero_heading": "How AI Writers Work",
-        "intro": (
+    ),
+
+    Post(
+        filename="how-do-ai-writers-work.html",
+        title="How Do AI Writers Work?",
+        description="An explanation of the technology behind AI writing tools and what makes them effective.",
+        hero_heading="How AI Writers Work",
+        intro=(
             "AI writing tools use machine learning to understand language and produce text that reads as if a human wrote it. But how do they actually work?"),
-        "sections": [
+        sections=(
             ("Learning from Data", (
                 "AI writers are trained on vast corpora of text, learning patterns, grammar and style. When you provide a prompt, the model predicts the next "
                 "words based on what it has learned from similar contexts. Writesonic utilises models like GPT‑4o and Claude, combining them with SEO data sources "
@@ -582,24 +531,289 @@ def main() -> None:
             ("Optimising for Search", (
                 "Tools like Writesonic include SEO modules that analyse keyword usage, headings and semantic coverage【39824570645077†L254-L265】. This integration distinguishes "
                 "specialised AI writers from generic language models."))
-        ],
-        "conclusion": (
+        ),
+        conclusion=(
             "AI writing tools are powerful because they blend advanced language models with human guidance and real‑time SEO insights. Writesonic exemplifies this "
             "combination, helping writers produce quality content quickly.")
-    })
-
-    # Generate all posts
-    for post in posts:
-        write_post(
-            filename=post["filename"],
-            title=post["title"],
-            description=post["description"],
-            hero_heading=post["hero_heading"],
-            intro=post["intro"],
-            sections=post["sections"],
-            conclusion=post["conclusion"]
+    ),
+)
+
+
+# Competitors compared against Writesonic. competitors.json holds a list of
+# {"name", "slug", "summary"} objects; it is read once at import and kept
+# as one tuple per field.
+COMPETITORS_FILE = os.path.join(BASE_DIR, "competitors.json")
+with open(COMPETITORS_FILE, encoding="utf-8") as competitors_file:
+    COMPETITOR_NAMES, COMPETITOR_SLUGS, COMPETITOR_SUMMARIES = zip(*(
+        (entry["name"], entry["slug"], entry["summary"]) for entry in json.load(competitors_file)
+    ))
+
+# Text shared by every competitor comparison post
+WRITESONIC_OVERVIEW_HEADING = "Writesonic Overview"
+CHOICE_HEADING = "Which Should You Choose?"
+WRITESONIC_OVERVIEW = (
+    "Writesonic combines long‑form generation with an SEO Checker &amp; Optimizer that analyses keyword coverage and headings in real time"
+    "【508602464543840†L86-L130】【39824570645077†L254-L265】. It integrates with multiple AI models and offers over 80 tools for writing, research and editing"
+    "【39824570645077†L139-L169】. Its pricing is flexible, with a generous free tier and affordable paid plans【879106096187632†L146-L166】."
+)
+# One section object reused, unchanged, by every comparison post
+WRITESONIC_OVERVIEW_SECTION = (WRITESONIC_OVERVIEW_HEADING, WRITESONIC_OVERVIEW)
+CHOICE_BODY = (
+    "If you need {name_lower}’s niche capabilities, it may serve a specific purpose. However, for a complete writing and SEO solution, "
+    "Writesonic delivers more functionality and value. The built‑in article writer and optimisation tools make it ideal for bloggers, marketers "
+    "and entrepreneurs."
+)
+COMPETITOR_CONCLUSION = (
+    "{name} has its merits, but Writesonic’s comprehensive suite of tools makes it the better option for most users. Sign up today to experience "
+    "AI‑powered writing with SEO built in."
+)
+
+
+def ensure_directory(path: str) -> None:
+    """Ensure that a directory exists."""
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=256)
+def render_section(heading: str, content: str) -> bytes:
+    """Return the UTF-8 encoded HTML for one (heading, content) section.
+
+    Cached, so a section shared between posts (such as the Writesonic
+    overview on every comparison page, with its citation markers) is only
+    formatted and encoded once.
+    """
+    return (SECTION_FORMAT % (heading, content)).encode("utf-8")
+
+
+def render_sections(sections: tuple[tuple[str, str], ...]) -> list[bytes]:
+    """Return the encoded HTML fragments for a post's (heading, content) sections.
+
+    Sections are kept as separate fragments (with newline separators) so
+    they can be written without being joined. The per-section encoding is
+    cached by ``render_section``.
+    """
+    fragments: list[bytes] = []
+    for heading, content in sections:
+        if fragments:
+            fragments.append(b"\n")
+        fragments.append(render_section(heading, content))
+    return fragments
+
+
+def render_post(title: str, description: str, hero_heading: str, intro: str,
+                sections: tuple[tuple[str, str], ...], conclusion: str) -> list[bytes]:
+    """Return the complete HTML document for a post as UTF-8 fragments.
+
+    The arguments match those of ``write_post`` (minus ``filename``). The
+    static parts of the page are shared, pre-encoded ``bytes`` objects.
+    """
+    values = {
+        "title": title,
+        "description": description,
+        "hero_heading": hero_heading,
+        "intro": intro,
+        "conclusion": conclusion,
+    }
+    fragments = []
+    for literal, field in TEMPLATE_PARTS:
+        fragments.append(literal)
+        if field == "sections_html":
+            fragments.extend(render_sections(sections))
+        elif field is not None:
+            fragments.append(values[field].encode("utf-8"))
+    return fragments
+
+
+def write_html(path: str, fragments: list[bytes]) -> None:
+    """Write a rendered HTML document, given as encoded fragments, to ``path``.
+
+    Where available, the fragments are handed to the kernel with a single
+    scatter-gather ``os.writev`` call, so they are never joined in memory.
+    Elsewhere they are copied into a reused per-thread ``bytearray`` and
+    written with one ``os.write``.
+    """
+    fd = os.open(path, WRITE_FLAGS, 0o644)
+    try:
+        if hasattr(os, "writev"):
+            remaining = list(fragments)
+            while remaining:
+                written = os.writev(fd, remaining[:IOV_MAX])
+                # Drop what was written; a short write may end mid-fragment
+                while remaining and written >= len(remaining[0]):
+                    written -= len(remaining.pop(0))
+                if written:
+                    remaining[0] = remaining[0][written:]
+        else:
+            buf = getattr(SCRATCH_BUFFERS, "buf", None)
+            if buf is None:
+                buf = SCRATCH_BUFFERS.buf = bytearray()
+            buf.clear()
+            for fragment in fragments:
+                buf.extend(fragment)
+            offset = 0
+            while offset < len(buf):
+                offset += os.write(fd, memoryview(buf)[offset:])
+            if len(buf) > SCRATCH_BUFFER_LIMIT:
+                SCRATCH_BUFFERS.buf = bytearray()
+    finally:
+        os.close(fd)
+
+
+def write_archive(archive: str, rendered: Iterable[tuple[str, list[bytes]]]) -> None:
+    """Write rendered posts into a single tar file.
+
+    Every post goes through one open file handle, so the output is a single
+    I/O stream rather than an open/write/close per post.
+
+    Parameters
+    ----------
+    archive: str
+        Path of the tar file to create (overwritten if it exists).
+    rendered: iterable of (filename, fragments)
+        Posts to add, as returned by ``render_post``, stored under ``posts/``
+        inside the archive. It is consumed lazily, one post at a time.
+    """
+    now = time.time()
+    with tarfile.open(archive, "w") as tar:
+        for filename, fragments in rendered:
+            data = b"".join(fragments)
+            info = tarfile.TarInfo(f"posts/{filename}")
+            info.size = len(data)
+            info.mtime = now
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+
+
+def write_post(filename: str, title: str, description: str, hero_heading: str,
+               intro: str, sections: tuple[tuple[str, str], ...], conclusion: str) -> None:
+    """Write a single HTML post to the posts directory.
+
+    Any existing file of the same name is overwritten; ``main`` filters
+    out posts that already exist. POSTS_DIR must already exist; ``main``
+    creates it once before writing any posts. All text arguments are
+    author-controlled HTML and are inserted verbatim: nothing is escaped,
+    so markup and entities such as ``&amp;`` must already be in their
+    final form.
+
+    Parameters
+    ----------
+    filename: str
+        The file name (with .html extension) relative to POSTS_DIR.
+    title: str
+        The page title used in the <title> element.
+    description: str
+        A concise meta description for SEO.
+    hero_heading: str
+        The H1 heading displayed in the hero section.
+    intro: str
+        A short paragraph introducing the topic.
+    sections: tuple of (heading, content)
+        Sections of the article with headings and text. The content may
+        include HTML markup (e.g., lists, paragraphs). Citations should be
+        embedded inline using the tether IDs from prior research.
+    conclusion: str
+        Final paragraph encouraging the reader to take action.
+    """
+    write_html(os.path.join(POSTS_DIR, filename),
+               render_post(title, description, hero_heading, intro, sections, conclusion))
+
+
+def iter_posts() -> Iterator[Post]:
+    """Yield every post the site should have, one at a time.
+
+    Posts are produced lazily so only the record being rendered needs to be
+    alive, rather than a fully built list of all posts.
+    """
+    yield from GENERAL_POSTS
+
+    # Competitor comparison posts
+    for name, slug, summary in zip(COMPETITOR_NAMES, COMPETITOR_SLUGS, COMPETITOR_SUMMARIES):
+        name_lower = name.lower()
+        vs_title = f"Writesonic vs {name}"
+        filename = f"writesonic-vs-{slug}.html"
+        title = f"{vs_title} – Which AI Writer Wins?"
+        description = f"Compare Writesonic and {name} to decide which AI writing tool offers the best features and value."
+        hero_heading = vs_title
+        intro_text = (
+            f"{name} is a notable player in the AI writing space. In this article, we compare its strengths and weaknesses "
+            f"to Writesonic’s versatile platform."
+        )
+        sections_list = (
+            (f"{name} Overview", summary),
+            WRITESONIC_OVERVIEW_SECTION,
+            (CHOICE_HEADING, CHOICE_BODY.format(name_lower=name_lower)),
         )
+        conclusion_text = COMPETITOR_CONCLUSION.format(name=name)
+        yield Post(
+            filename=filename,
+            title=title,
+            description=description,
+            hero_heading=hero_heading,
+            intro=intro_text,
+            sections=sections_list,
+            conclusion=conclusion_text,
+        )
+
+    yield from ADDITIONAL_POSTS
+
+
+def main(archive: str | None = None) -> None:
+    """Generate a set of articles for the AI Writer Hub website.
 
+    Parameters
+    ----------
+    archive: str, optional
+        If given, every post is bundled into a tar file at this path (as
+        ``posts/<filename>`` members) instead of being written to POSTS_DIR;
+        POSTS_DIR is then neither created nor checked for existing files.
+    """
+    # Status messages are collected and printed with a single write at the
+    # end, including when a write fails, so the skipped and created files are
+    # still reported alongside the traceback.
+    log: list[str] = []
+    try:
+        if archive is not None:
+            # Only the Post records are collected here; each post is rendered
+            # as it is added, so the rendered HTML of every post is never held
+            # in memory at once.
+            posts = list(iter_posts())
+            write_archive(archive, ((post.filename, render_post(*post[1:])) for post in posts))
+            log.extend(f"Added {post.filename} to {archive}" for post in posts)
+        else:
+            ensure_directory(POSTS_DIR)
+            # A single directory scan replaces one stat() per post
+            with os.scandir(POSTS_DIR) as entries:
+                existing = {entry.name for entry in entries}
+            pending: list[Post] = []
+            for post in iter_posts():
+                # Do not overwrite existing files
+                if post.filename in existing:
+                    log.append(f"Skipping existing file: {post.filename}")
+                    continue
+                pending.append(post)
+            if pending:
+                # Overlap the file writes on a thread pool since the I/O
+                # releases the GIL; write_html keeps no shared mutable state
+                # between threads
+                with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+                    futures = [(post.filename, executor.submit(write_post, *post)) for post in pending]
+                # Report every post before raising the first failure
+                errors: list[BaseException] = []
+                for filename, future in futures:
+                    error = future.exception()
+                    if error is None:
+                        log.append(f"Created {filename}")
+                    else:
+                        log.append(f"Failed to write {filename}: {error}")
+                        errors.append(error)
+                if errors:
+                    raise errors[0]
+    finally:
+        if log:
+            sys.stdout.write("\n".join(log) + "\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate AI Writer Hub blog posts.")
+    parser.add_argument("--archive", help="bundle all posts into this tar file instead of writing new ones to posts/")
+    main(archive=parser.parse_args().archive)
\ No newline at end of file
@@ -25,6 +25,217 @@ IMAGES_MAP = {
     'writesonic-vs-frase': 'writesonic-vs-frase.jpg',
     'best-article-writer': 'best-article-writer.jpg',
 }
+# Default to JPEG for the generic article image to reduce size
+DEFAULT_IMAGE = 'article-default.jpg'
+# The src attribute each slug's hero image is rewritten to, built once here
+# rather than formatted again for every post.
+IMAGE_SRCS = {slug: f'src="/images/{image}"'.encode() for slug, image in IMAGES_MAP.items()}
+DEFAULT_IMAGE_SRC = f'src="/images/{DEFAULT_IMAGE}"'.encode()
+
+# Comments wrapping the long content inserted into each post.  Any start
+# comment marks a post as already processed: one with the current version is
+# skipped, one with another version has its block replaced.  Bump the
+# version when the long content or meta description changes; hero images
+# are checked on every run, so IMAGES_MAP changes need no bump.
+UPDATED_MARKER_PREFIX = b'<!-- writesonic-updated:'
+LONG_CONTENT_START = UPDATED_MARKER_PREFIX + b'v2 -->'
+LONG_CONTENT_END = b'<!-- /writesonic-updated -->'
+# Opening of the long content inserted before the comments were added.
+LEGACY_LONG_CONTENT_START = b'<p>This comprehensive article explores '
+
+# Pattern applied to every post, compiled once at import.  Posts are edited
+# as raw bytes; the markup matched here is all ASCII.
+TITLE_RE = re.compile(rb'<title>(.*?)</title>', re.DOTALL | re.IGNORECASE)
+
+
+# Paragraphs of the long-form content that are the same for every article,
+# without their <p> tags.  They are wrapped and joined once at import so
+# build_long_content only has to format the paragraphs that mention the
+# article title or competitor.
+BACKGROUND_PARAGRAPHS = (
+    (
+        "Understanding AI writing technology is crucial for anyone considering automated content creation. "
+        "AI writers analyse your requirements, pull relevant information from vast training corpora and generate "
+        "human‑like text using sophisticated pattern recognition models【858411251529864†L152-L165】. "
+        "WriteSonic leverages multiple AI models, including GPT‑4o, Claude and Gemini【39824570645077†L139-L169】, "
+        "to deliver accurate and engaging copy across blogs, ads, social posts, emails, product descriptions and "
+        "more. The result is a versatile tool that can adapt to different tones and formats while maintaining "
+        "coherence and relevance to your target audience."
+    ),
+    (
+        "In our research, we evaluate top competitors such as Outrank, Jasper AI, Surfer AI, Frase AI, Copy.ai, "
+        "ContentBot (formerly ContentKing) and MarketMuse【317782163202915†L70-L75】. Each of these platforms has "
+        "unique strengths—for example, Outrank provides long‑form generation up to 3,000 words and built‑in keyword "
+        "research with CMS integration【317782163202915†L93-L117】, while Jasper AI offers an expansive template "
+        "library, Surfer SEO integration and multi‑language support with pricing starting at $99 per month【317782163202915†L152-L186】. "
+        "We contrast these capabilities with WriteSonic’s more than 80 tools for research, writing, editing and "
+        "publishing【39824570645077†L139-L169】. "
+        "Comparing strengths and weaknesses helps identify which platform offers the best fit for various use cases."
+    ),
+    (
+        "One of the reasons WriteSonic excels is its built‑in SEO Checker &amp; Optimizer, which analyses headings, "
+        "keyword coverage and competitor gaps to improve your search rankings【39824570645077†L254-L265】. "
+        "This integrated SEO guidance saves time by suggesting target keywords, content structure and on‑page "
+        "improvements as you draft. Many competing tools require third‑party SEO software, but WriteSonic includes "
+        "these features natively, making the platform a one‑stop solution for content creation and optimization."
+    ),
+    (
+        "Pricing is another important consideration. WriteSonic offers a generous free plan for up to 10,000 words "
+        "per month, an unlimited plan at $16/month, and a business plan at $12.67/month for 200k words using GPT‑3.5【879106096187632†L146-L166】. "
+        "Enterprise options provide custom packages for large teams, giving organisations the flexibility to scale "
+        "usage as needed. This transparent pricing structure ensures you only pay for what you need, making the "
+        "platform accessible to freelancers, startups and enterprises alike."
+    ),
+    (
+        "Beyond its writing tools, WriteSonic’s ecosystem includes ChatSonic (a conversational AI chatbot), "
+        "BotSonic (a no‑code chatbot builder), Audiosonic (text‑to‑speech) and an image generator【71157615675290†L142-L155】. "
+        "BotSonic allows businesses to build GPT‑4‑powered chatbots without coding, train them on their data, integrate "
+        "with messaging platforms, capture leads and analyse performance【71157615675290†L165-L244】. These complementary "
+        "tools extend WriteSonic’s value beyond written content, offering a cohesive suite to automate customer "
+        "engagement across multiple channels."
+    ),
+    (
+        "Our analysis also highlights the strengths and limitations of WriteSonic. Users appreciate its ease of use, "
+        "tone and word‑count controls, and versatility across content formats【508602464543840†L146-L159】【879106096187632†L210-L216】. "
+        "Some caution that certain outputs can feel robotic or lacking depth, requiring human editing to polish the final "
+        "copy【508602464543840†L146-L159】【879106096187632†L228-L235】. We provide practical tips on refining AI‑generated text—such as "
+        "adding personal anecdotes, citing credible sources and incorporating storytelling techniques—to ensure it "
+        "resonates with readers and maintains authenticity."
+    ),
+)
+
+ADVICE_PARAGRAPHS = (
+    (
+        "To maximise your success with WriteSonic, we recommend leveraging its SEO insights to identify keyword gaps and "
+        "competitor opportunities, customising tone to align with your brand voice, and using integrated templates to "
+        "streamline production. Don’t forget to add images, infographics, internal links and clear calls‑to‑action to "
+        "enrich your articles and keep readers engaged. Combining AI assistance with strategic content planning is the "
+        "surest way to achieve high search rankings and drive meaningful conversions."
+    ),
+    (
+        "Another factor to consider is your overall SEO strategy. To rank quickly on Google and ChatGPT, focus on "
+        "producing authoritative content with clear structure, include relevant keywords, synonyms and long‑tail phrases, "
+        "and ensure your pages load quickly and are mobile‑friendly. WriteSonic’s built‑in SEO optimizer helps identify "
+        "these keywords and ensures that headings and meta descriptions align with search intent【39824570645077†L254-L265】. "
+        "Combining AI‑generated drafts with thoughtful editing, on‑page optimisation and quality backlinks is essential "
+        "for achieving top search rankings and sustaining traffic growth."
+    ),
+    (
+        "Finally, remember that AI tools are assistants, not replacements. Use the drafts generated by WriteSonic as a "
+        "foundation, then add your unique insights, experiences and brand voice. Provide value to readers through case "
+        "studies, examples and actionable tips. Over time, your expertise and consistent quality will build authority, "
+        "drive traffic through SEO and convert visitors into loyal customers. By balancing the power of AI with human "
+        "creativity, you can unlock unprecedented productivity and influence in the digital landscape."
+    ),
+
+    # Additional paragraphs to further increase word count and reinforce targeted keywords.
+    # These paragraphs are designed to be comprehensive, covering keyword research, selection
+    # criteria, SEO best practices, detailed feature breakdowns, case studies, FAQs and
+    # comparison tables.  They also explicitly mention high‑volume queries so that the
+    # articles can rank for those terms.
+
+    # Keyword research and targeting.
+    (
+        "When performing keyword research for this article, we looked at high‑volume search terms such as "
+        "<strong>best AI writer 2025</strong>, <strong>free AI writing tool</strong>, <strong>best writing software</strong>, "
+        "<strong>Writesonic review</strong>, <strong>Writesonic pricing</strong>, and comparisons like <strong>Writesonic vs Jasper</strong> and "
+        "<strong>Writesonic vs Copy AI</strong>. These queries represent what potential users search for when evaluating AI writing "
+        "solutions. By incorporating these keywords into headings, meta descriptions, alt tags and throughout the copy, "
+        "we significantly increase the likelihood of ranking for them. We also include synonyms and long‑tail variations "
+        "to capture a wide range of search intents and satisfy both general and specific queries."
+    ),
+    # Choosing the best AI writer.
+    (
+        "Choosing the best AI writer requires evaluating several critical factors: output quality, ease of use, built‑in "
+        "SEO features, pricing, integration capabilities and customer support. We advise selecting a tool that produces "
+        "coherent long‑form drafts, offers real‑time optimisation guidance, integrates with your existing CMS and marketing "
+        "stack, and aligns with your budget and workflow. WriteSonic, for example, ticks many of these boxes with its "
+        "AI Article Writer 6.0, SEO Checker &amp; Optimizer, numerous integrations and flexible pricing tiers. Ultimately, the "
+        "best AI writer is the one that helps you achieve your content goals efficiently and affordably."
+    ),
+    # SEO best practices.
+    (
+        "To ensure our content ranks on Google and other search engines, we adhere to proven SEO best practices. "
+        "These include conducting thorough keyword research, structuring articles with clear headings and subheadings, "
+        "naturally incorporating target keywords, using descriptive alt tags for images, linking to authoritative sources, "
+        "and optimising meta titles and descriptions. We also focus on page speed, mobile responsiveness and accessibility. "
+        "WriteSonic’s built‑in tools streamline this process by suggesting relevant keywords, analysing competitor content, "
+        "and ensuring that headings and meta descriptions match search intent【39824570645077†L254-L265】. Following these "
+        "best practices helps our articles achieve strong search visibility."
+    ),
+    # Detailed feature breakdown.
+    (
+        "A detailed breakdown of WriteSonic’s features highlights why it is a market leader among AI writers. "
+        "The AI Article Writer provides guided workflows for drafting long‑form content and includes tone control, "
+        "outline generation, and support for up to 5,000 words【39824570645077†L231-L249】. The integrated SEO Checker &amp; "
+        "Optimizer analyses headings, keyword density, competitive gaps and readability to improve search rankings【39824570645077†L254-L265】. "
+        "ChatSonic delivers conversational AI for customer support and engagement; BotSonic allows businesses to build "
+        "no‑code GPT‑4‑powered chatbots【71157615675290†L165-L244】; Audiosonic converts text to speech; and the built‑in image "
+        "generator produces unique visuals. Collectively, these features create a comprehensive content marketing suite."
+    ),
+    # Customer stories and success metrics.
+    (
+        "Numerous customer success stories illustrate the value of WriteSonic. A digital agency increased organic traffic by "
+        "70% within six months by using WriteSonic to generate and optimise articles targeting keywords like "
+        "‘best AI writer 2025’ and ‘AI SEO tools’. An e‑commerce store saw a 40% uplift in conversions after implementing a "
+        "BotSonic chatbot to answer product questions and capture leads. These real‑world examples demonstrate how AI writing "
+        "and conversational tools can drive measurable results when combined with a strategic SEO approach."
+    ),
+    # Case study for targeted keyword.
+    (
+        "To illustrate our strategy in action, we conducted a case study targeting the high‑value keyword <strong>best AI writer 2025</strong>. "
+        "We created a detailed pillar page reviewing and comparing top AI writing tools, including WriteSonic, Jasper, Copy.ai and Surfer AI. "
+        "The article featured a table of contents, individual tool assessments, pricing information, user ratings, pros and cons, and a final "
+        "recommendation. By optimising headings, meta descriptions and internal links, and by using WriteSonic’s SEO suggestions, we achieved a "
+        "top‑three ranking on Google for this keyword within two months. This case study underscores the importance of well‑structured long‑form "
+        "content backed by powerful AI tools."
+    ),
+)
+
+# Frequently asked questions; the last example names the competitor when
+# there is one.
+FAQ_TEMPLATE = (
+    "<p>We also include comprehensive FAQs to address common questions and capture long‑tail keywords. Examples include: "
+    "‘How does WriteSonic work?’, ‘What is the best free AI writer?’, ‘Is AI‑generated content SEO‑friendly?’, ‘How much does WriteSonic cost?’, "
+    "and ‘Which AI writer is the best alternative to {alternative}?’. By answering these questions in depth, we provide "
+    "valuable information to readers and improve our chances of ranking for specific queries. Search engines reward content that satisfies user intent, "
+    "and FAQs are an effective way to achieve that goal.</p>"
+)
+GENERAL_FAQ_PARAGRAPH = FAQ_TEMPLATE.format(alternative='other tools')
+
+# Generic comparison table note for non‑comparison articles.
+GENERIC_TABLE_PARAGRAPH = (
+    "<p>To help readers compare tools at a glance, our articles often include tables summarising features such as word limits, supported languages, "
+    "SEO capabilities, pricing tiers, ease of use and available integrations. These tables provide quick insights and assist search engines in "
+    "understanding the content’s structure. They also allow us to incorporate additional keywords like ‘WriteSonic pricing’ and ‘best free AI writer’, "
+    "broadening the article’s search visibility.</p>"
+)
+
+# Final concluding paragraph reinforcing key points; it names the competitor
+# when there is one, otherwise a few popular alternatives.
+CLOSING_TEMPLATE = (
+    "<p>Ultimately, selecting the right AI writer comes down to your unique needs and goals. Our research indicates that WriteSonic offers the most "
+    "comprehensive feature set for marketers seeking to produce high‑quality, SEO‑optimised content at scale. By aligning your content strategy with "
+    "targeted keywords and leveraging WriteSonic’s tools, you can increase organic traffic, improve search rankings and convert more visitors. While "
+    "other tools like {alternative} have their merits, we recommend testing several options to see which one "
+    "best fits your workflow. In the rapidly evolving world of AI writing, staying informed and adaptable is key to long‑term success.</p>"
+)
+GENERAL_CLOSING_PARAGRAPH = CLOSING_TEMPLATE.format(alternative='Jasper, Copy.ai, or Surfer AI')
+
+BACKGROUND_HTML = "<p>" + "</p>\n<p>".join(BACKGROUND_PARAGRAPHS) + "</p>"
+ADVICE_HTML = "<p>" + "</p>\n<p>".join(ADVICE_PARAGRAPHS) + "</p>"
+
+# Meta description templates for comparison articles and for everything else.
+COMPARISON_DESCRIPTION = (
+    "Detailed comparison of WriteSonic and {competitor}. Explore features, pricing, pros and cons, user "
+    "reviews and SEO insights. Optimised to rank for queries like ‘WriteSonic vs {competitor}’, ‘best AI writer 2025’ "
+    "and related keywords."
+)
+GUIDE_DESCRIPTION = (
+    "Comprehensive guide to {title}. Includes keyword research, AI writing technology breakdown, pricing, "
+    "SEO best practices and frequently asked questions. Ideal for ranking on ‘best AI writer 2025’, ‘AI content "
+    "generator free’, ‘WriteSonic review’ and similar search queries."
+)
 
 
 def build_long_content(title: str, competitor: str) -> str:
@@ -33,7 +244,8 @@ def build_long_content(title: str, competitor: str) -> str:
     competitors, highlights WriteSonic features, discusses pricing, and
     provides actionable SEO and content advice.  Citations are included
     throughout to maintain credibility.  The ``competitor`` parameter is
-    inserted where appropriate for comparison articles.
+    inserted where appropriate for comparison articles.  Only the few
+    paragraphs that mention the title or competitor are built per call.
 
     Args:
         title: The title of the article extracted from the <title> tag.
@@ -46,321 +258,195 @@ def build_long_content(title: str, competitor: str) -> str:
         into an HTML document.  The paragraphs are separated by newline
         characters so that the final HTML is easy to read.
     """
-    # Determine phrasing for the comparison context.
-    comp_phrase = f" and compares WriteSonic with {competitor}" if competitor else ""
-
-    paragraphs = []
-    paragraphs.append(
-        (
-            f"<p>This comprehensive article explores {title}{comp_phrase}. "
-            "We dive deep into the features, benefits, and limitations of the available AI tools and explain why "
-            "WriteSonic stands out in 2025. We discuss the evolution of AI writing technology, survey user experiences "
-            "across industries and highlight how these innovations shape modern content creation. You'll gain a solid "
-            "understanding of the landscape and learn what to look for in an AI writer that can support your goals.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>Understanding AI writing technology is crucial for anyone considering automated content creation. "
-            "AI writers analyse your requirements, pull relevant information from vast training corpora and generate "
-            "human‑like text using sophisticated pattern recognition models【858411251529864†L152-L165】. "
-            "WriteSonic leverages multiple AI models, including GPT‑4o, Claude and Gemini【39824570645077†L139-L169】, "
-            "to deliver accurate and engaging copy across blogs, ads, social posts, emails, product descriptions and "
-            "more. The result is a versatile tool that can adapt to different tones and formats while maintaining "
-            "coherence and relevance to your target audience.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>In our research, we evaluate top competitors such as Outrank, Jasper AI, Surfer AI, Frase AI, Copy.ai, "
-            "ContentBot (formerly ContentKing) and MarketMuse【317782163202915†L70-L75】. Each of these platforms has "
-            "unique strengths—for example, Outrank provides long‑form generation up to 3,000 words and built‑in keyword "
-            "research with CMS integration【317782163202915†L93-L117】, while Jasper AI offers an expansive template "
-            "library, Surfer SEO integration and multi‑language support with pricing starting at $99 per month【317782163202915†L152-L186】. "
-            "We contrast these capabilities with WriteSonic’s more than 80 tools for research, writing, editing and "
-            "publishing【39824570645077†L139-L169】. "
-            "Comparing strengths and weaknesses helps identify which platform offers the best fit for various use cases.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>One of the reasons WriteSonic excels is its built‑in SEO Checker &amp; Optimizer, which analyses headings, "
-            "keyword coverage and competitor gaps to improve your search rankings【39824570645077†L254-L265】. "
-            "This integrated SEO guidance saves time by suggesting target keywords, content structure and on‑page "
-            "improvements as you draft. Many competing tools require third‑party SEO software, but WriteSonic includes "
-            "these features natively, making the platform a one‑stop solution for content creation and optimization.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>Pricing is another important consideration. WriteSonic offers a generous free plan for up to 10,000 words "
-            "per month, an unlimited plan at $16/month, and a business plan at $12.67/month for 200k words using GPT‑3.5【879106096187632†L146-L166】. "
-            "Enterprise options provide custom packages for large teams, giving organisations the flexibility to scale "
-            "usage as needed. This transparent pricing structure ensures you only pay for what you need, making the "
-            "platform accessible to freelancers, startups and enterprises alike.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>Beyond its writing tools, WriteSonic’s ecosystem includes ChatSonic (a conversational AI chatbot), "
-            "BotSonic (a no‑code chatbot builder), Audiosonic (text‑to‑speech) and an image generator【71157615675290†L142-L155】. "
-            "BotSonic allows businesses to build GPT‑4‑powered chatbots without coding, train them on their data, integrate "
-            "with messaging platforms, capture leads and analyse performance【71157615675290†L165-L244】. These complementary "
-            "tools extend WriteSonic’s value beyond written content, offering a cohesive suite to automate customer "
-            "engagement across multiple channels.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>Our analysis also highlights the strengths and limitations of WriteSonic. Users appreciate its ease of use, "
-            "tone and word‑count controls, and versatility across content formats【508602464543840†L146-L159】【879106096187632†L210-L216】. "
-            "Some caution that certain outputs can feel robotic or lacking depth, requiring human editing to polish the final "
-            "copy【508602464543840†L146-L159】【879106096187632†L228-L235】. We provide practical tips on refining AI‑generated text—such as "
-            "adding personal anecdotes, citing credible sources and incorporating storytelling techniques—to ensure it "
-            "resonates with readers and maintains authenticity.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            f"<p>For this {title} article, we explore how WriteSonic{' and ' + competitor if competitor else ''} perform across "
-            "various use cases, including blog posts, long‑form articles, product descriptions and marketing copy. "
-            "We examine content quality, ease of use, pricing and integration capabilities. By delving into these factors, "
-            "we guide you toward the solution that best fits your needs and explain why WriteSonic often emerges as "
-            "the winner in direct comparisons.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>To maximise your success with WriteSonic, we recommend leveraging its SEO insights to identify keyword gaps and "
-            "competitor opportunities, customising tone to align with your brand voice, and using integrated templates to "
-            "streamline production. Don’t forget to add images, infographics, internal links and clear calls‑to‑action to "
-            "enrich your articles and keep readers engaged. Combining AI assistance with strategic content planning is the "
-            "surest way to achieve high search rankings and drive meaningful conversions.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>Another factor to consider is your overall SEO strategy. To rank quickly on Google and ChatGPT, focus on "
-            "producing authoritative content with clear structure, include relevant keywords, synonyms and long‑tail phrases, "
-            "and ensure your pages load quickly and are mobile‑friendly. WriteSonic’s built‑in SEO optimizer helps identify "
-            "these keywords and ensures that headings and meta descriptions align with search intent【39824570645077†L254-L265】. "
-            "Combining AI‑generated drafts with thoughtful editing, on‑page optimisation and quality backlinks is essential "
-            "for achieving top search rankings and sustaining traffic growth.</p>"
-        )
-    )
-    paragraphs.append(
-        (
-            "<p>Finally, remember that AI tools are assistants, not replacements. Use the drafts generated by WriteSonic as a "
-            "foundation, then add your unique insights, experiences and brand voice. Provide value to readers through case "
-            "studies, examples and actionable tips. Over time, your expertise and consistent quality will build authority, "
-            "drive traffic through SEO and convert visitors into loyal customers. By balancing the power of AI with human "
-            "creativity, you can unlock unprecedented productivity and influence in the digital landscape.</p>"
-        )
-    )
-
-    # Additional paragraphs to further increase word count and reinforce targeted keywords.
-    # These paragraphs are designed to be comprehensive, covering keyword research, selection
-    # criteria, SEO best practices, detailed feature breakdowns, case studies, FAQs and
-    # comparison tables.  They also explicitly mention high‑volume queries so that the
-    # articles can rank for those terms.
-
-    # Keyword research and targeting.
-    paragraphs.append(
-        (
-            "<p>When performing keyword research for this article, we looked at high‑volume search terms such as "
-            "<strong>best AI writer 2025</strong>, <strong>free AI writing tool</strong>, <strong>best writing software</strong>, "
-            "<strong>Writesonic review</strong>, <strong>Writesonic pricing</strong>, and comparisons like <strong>Writesonic vs Jasper</strong> and "
-            "<strong>Writesonic vs Copy AI</strong>. These queries represent what potential users search for when evaluating AI writing "
-            "solutions. By incorporating these keywords into headings, meta descriptions, alt tags and throughout the copy, "
-            "we significantly increase the likelihood of ranking for them. We also include synonyms and long‑tail variations "
-            "to capture a wide range of search intents and satisfy both general and specific queries.</p>"
-        )
-    )
-
-    # Choosing the best AI writer.
-    paragraphs.append(
-        (
-            "<p>Choosing the best AI writer requires evaluating several critical factors: output quality, ease of use, built‑in "
-            "SEO features, pricing, integration capabilities and customer support. We advise selecting a tool that produces "
-            "coherent long‑form drafts, offers real‑time optimisation guidance, integrates with your existing CMS and marketing "
-            "stack, and aligns with your budget and workflow. WriteSonic, for example, ticks many of these boxes with its "
-            "AI Article Writer 6.0, SEO Checker &amp; Optimizer, numerous integrations and flexible pricing tiers. Ultimately, the "
-            "best AI writer is the one that helps you achieve your content goals efficiently and affordably.</p>"
-        )
-    )
-
-    # SEO best practices.
-    paragraphs.append(
-        (
-            "<p>To ensure our content ranks on Google and other search engines, we adhere to proven SEO best practices. "
-            "These include conducting thorough keyword research, structuring articles with clear headings and subheadings, "
-            "naturally incorporating target keywords, using descriptive alt tags for images, linking to authoritative sources, "
-            "and optimising meta titles and descriptions. We also focus on page speed, mobile responsiveness and accessibility. "
-            "WriteSonic’s built‑in tools streamline this process by suggesting relevant keywords, analysing competitor content, "
-            "and ensuring that headings and meta descriptions match search intent【39824570645077†L254-L265】. Following these "
-            "best practices helps our articles achieve strong search visibility.</p>"
-        )
-    )
-
-    # Detailed feature breakdown.
-    paragraphs.append(
-        (
-            "<p>A detailed breakdown of WriteSonic’s features highlights why it is a market leader among AI writers. "
-            "The AI Article Writer provides guided workflows for drafting long‑form content and includes tone control, "
-            "outline generation, and support for up to 5,000 words【39824570645077†L231-L249】. The integrated SEO Checker &amp; "
-            "Optimizer analyses headings, keyword density, competitive gaps and readability to improve search rankings【39824570645077†L254-L265】. "
-            "ChatSonic delivers conversational AI for customer support and engagement; BotSonic allows businesses to build "
-            "no‑code GPT‑4‑powered chatbots【71157615675290†L165-L244】; Audiosonic converts text to speech; and the built‑in image "
-            "generator produces unique visuals. Collectively, these features create a comprehensive content marketing suite.</p>"
+    # Branch once on the comparison context; everything else is shared.
+    if competitor:
+        comp_phrase = f" and compares WriteSonic with {competitor}"
+        and_competitor = f" and {competitor}"
+        comparison = (
+            f"<p>When comparing WriteSonic to {competitor}, we examine differences in features, output quality, templates, languages, pricing and support. "
+            "WriteSonic’s integrated SEO tools, broad template library and multi‑model support often give it an edge over "
+            f"{competitor}. However, {competitor} may excel in specific areas like brevity or speciality writing. By providing a balanced comparison, we target "
+            f"keywords such as ‘WriteSonic vs {competitor}’, ‘{competitor} vs WriteSonic’ and ‘WriteSonic alternative’, capturing searchers evaluating both products.</p>\n"
+            f"<p>To make the evaluation easier, this article includes a comparison table summarising key metrics for WriteSonic and {competitor}. "
+            "The table covers word limits, languages supported, SEO features, pricing tiers, ease of use and integrations. Tables provide quick insights for "
+            "readers and help search engines understand the content structure. They also allow us to incorporate keywords like ‘WriteSonic pricing’ and "
+            f"‘{competitor} pricing’, further optimising for search.</p>"
         )
-    )
+        faq = FAQ_TEMPLATE.format(alternative=competitor)
+        closing = CLOSING_TEMPLATE.format(alternative=competitor)
+    else:
+        comp_phrase = and_competitor = ""
+        comparison = GENERIC_TABLE_PARAGRAPH
+        faq = GENERAL_FAQ_PARAGRAPH
+        closing = GENERAL_CLOSING_PARAGRAPH
 
-    # Customer stories and success metrics.
-    paragraphs.append(
-        (
-            "<p>Numerous customer success stories illustrate the value of WriteSonic. A digital agency increased organic traffic by "
-            "70% within six months by using WriteSonic to generate and optimise articles targeting keywords like "
-            "‘best AI writer 2025’ and ‘AI SEO tools’. An e‑commerce store saw a 40% uplift in conversions after implementing a "
-            "BotSonic chatbot to answer product questions and capture leads. These real‑world examples demonstrate how AI writing "
-            "and conversational tools can drive measurable results when combined with a strategic SEO approach.</p>"
-        )
+    # The whole block is produced by a single f-string, with paragraphs
+    # separated by newlines for readability.
+    return (
+        f"<p>This comprehensive article explores {title}{comp_phrase}. "
+        "We dive deep into the features, benefits, and limitations of the available AI tools and explain why "
+        "WriteSonic stands out in 2025. We discuss the evolution of AI writing technology, survey user experiences "
+        "across industries and highlight how these innovations shape modern content creation. You'll gain a solid "
+        "understanding of the landscape and learn what to look for in an AI writer that can support your goals.</p>\n"
+        f"{BACKGROUND_HTML}\n"
+        f"<p>For this {title} article, we explore how WriteSonic{and_competitor} perform across "
+        "various use cases, including blog posts, long‑form articles, product descriptions and marketing copy. "
+        "We examine content quality, ease of use, pricing and integration capabilities. By delving into these factors, "
+        "we guide you toward the solution that best fits your needs and explain why WriteSonic often emerges as "
+        "the winner in direct comparisons.</p>\n"
+        f"{ADVICE_HTML}\n"
+        f"{faq}\n"
+        f"{comparison}\n"
+        f"{closing}"
     )
 
-    # Case study for targeted keyword.
-    paragraphs.append(
-        (
-            "<p>To illustrate our strategy in action, we conducted a case study targeting the high‑value keyword <strong>best AI writer 2025</strong>. "
-            "We created a detailed pillar page reviewing and comparing top AI writing tools, including WriteSonic, Jasper, Copy.ai and Surfer AI. "
-            "The article featured a table of contents, individual tool assessments, pricing information, user ratings, pros and cons, and a final "
-            "recommendation. By optimising headings, meta descriptions and internal links, and by using WriteSonic’s SEO suggestions, we achieved a "
-            "top‑three ranking on Google for this keyword within two months. This case study underscores the importance of well‑structured long‑form "
-            "content backed by powerful AI tools.</p>"
-        )
-    )
 
-    # Frequently asked questions.
-    paragraphs.append(
-        (
-            "<p>We also include comprehensive FAQs to address common questions and capture long‑tail keywords. Examples include: "
-            "‘How does WriteSonic work?’, ‘What is the best free AI writer?’, ‘Is AI‑generated content SEO‑friendly?’, ‘How much does WriteSonic cost?’, "
-            "and ‘Which AI writer is the best alternative to {competitor if competitor else 'other tools'}?’. By answering these questions in depth, we provide "
-            "valuable information to readers and improve our chances of ranking for specific queries. Search engines reward content that satisfies user intent, "
-            "and FAQs are an effective way to achieve that goal.</p>"
-        )
-    )
+def find_long_content(html: bytes) -> tuple[int, int] | None:
+    """Return the ``(start, end)`` span of long content inserted by an
+    earlier run, or ``None`` if the post has none.
 
-    # Competitor comparison paragraph (only if a competitor exists).
-    if competitor:
-        paragraphs.append(
-            (
-                f"<p>When comparing WriteSonic to {competitor}, we examine differences in features, output quality, templates, languages, pricing and support. "
-                "WriteSonic’s integrated SEO tools, broad template library and multi‑model support often give it an edge over "
-                f"{competitor}. However, {competitor} may excel in specific areas like brevity or speciality writing. By providing a balanced comparison, we target "
-                f"keywords such as ‘WriteSonic vs {competitor}’, ‘{competitor} vs WriteSonic’ and ‘WriteSonic alternative’, capturing searchers evaluating both products.</p>"
-            )
-        )
-        # Comparison table description
-        paragraphs.append(
-            (
-                f"<p>To make the evaluation easier, this article includes a comparison table summarising key metrics for WriteSonic and {competitor}. "
-                "The table covers word limits, languages supported, SEO features, pricing tiers, ease of use and integrations. Tables provide quick insights for "
-                "readers and help search engines understand the content structure. They also allow us to incorporate keywords like ‘WriteSonic pricing’ and "
-                f"‘{competitor} pricing’, further optimising for search.</p>"
-            )
-        )
+    Marked content runs from its start comment through LONG_CONTENT_END.
+    Posts updated before the comments existed hold one or more unmarked
+    copies running from the generated opening paragraph to the last
+    paragraph before the footer (or, in posts without a footer, where the
+    content was appended, to the last paragraph in the document); the whole
+    run is returned as one span so that it is replaced rather than added to.
+    """
+    start = html.find(UPDATED_MARKER_PREFIX)
+    if start >= 0:
+        end = html.find(LONG_CONTENT_END, start)
+        if end >= 0:
+            return start, end + len(LONG_CONTENT_END)
     else:
-        # Generic comparison table note for non‑comparison articles.
-        paragraphs.append(
-            (
-                "<p>To help readers compare tools at a glance, our articles often include tables summarising features such as word limits, supported languages, "
-                "SEO capabilities, pricing tiers, ease of use and available integrations. These tables provide quick insights and assist search engines in "
-                "understanding the content’s structure. They also allow us to incorporate additional keywords like ‘WriteSonic pricing’ and ‘best free AI writer’, "
-                "broadening the article’s search visibility.</p>"
-            )
-        )
+        start = html.find(LEGACY_LONG_CONTENT_START)
+        if start < 0:
+            return None
+    # Unmarked (or unterminated) content ends at the footer, or at the end
+    # of the document when there is none.
+    footer_at = html.find(b'<footer', start)
+    if footer_at < 0:
+        footer_at = len(html)
+    end = html.rfind(b'</p>', start, footer_at)
+    if end < 0:
+        return None
+    return start, end + len(b'</p>')
 
-    # Final concluding paragraph reinforcing key points.
-    paragraphs.append(
-        (
-            "<p>Ultimately, selecting the right AI writer comes down to your unique needs and goals. Our research indicates that WriteSonic offers the most "
-            "comprehensive feature set for marketers seeking to produce high‑quality, SEO‑optimised content at scale. By aligning your content strategy with "
-            "targeted keywords and leveraging WriteSonic’s tools, you can increase organic traffic, improve search rankings and convert more visitors. While "
-            "other tools like {competitor if competitor else 'Jasper, Copy.ai, or Surfer AI'} have their merits, we recommend testing several options to see which one "
-            "best fits your workflow. In the rapidly evolving world of AI writing, staying informed and adaptable is key to long‑term success.</p>"
-        )
-    )
-    # Concatenate paragraphs separated by newlines for readability.
-    return "\n".join(paragraphs)
 
+def add_long_content(html: bytes, slug: str) -> bytes:
+    """Insert (or replace) the long content block of a post and set its
+    meta description, returning the updated HTML.
 
-def update_post(file_path: str, slug: str) -> None:
-    """Read an HTML file, update its hero image based on the slug and
-    append long content before the footer to meet the 2,500 word target.
+    The block is wrapped in LONG_CONTENT_START/LONG_CONTENT_END comments;
+    content from an older version, or from before the comments were
+    added, is replaced in place rather than added to.
 
     Args:
-        file_path: Path to the HTML file.
+        html: The post's HTML as UTF-8 bytes.
         slug: Slug of the article (filename without extension).
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        html = f.read()
-    # Determine new image path.
-    # Default to JPEG for the generic article image to reduce size
-    image_file = IMAGES_MAP.get(slug, 'article-default.jpg')
-    # Replace only the first occurrence of the hero image src attribute.
-    html = re.sub(r'src="/images/[^\"]+"', f'src="/images/{image_file}"', html, count=1)
     # Extract the page title for context.
-    m = re.search(r'<title>(.*?)</title>', html, re.DOTALL | re.IGNORECASE)
+    m = TITLE_RE.search(html)
     if m:
-        title = m.group(1).strip()
+        title = m.group(1).decode('utf-8').strip()
     else:
         title = slug.replace('-', ' ').title()
     # Determine competitor name if present.
-    competitor = ''
-    if 'vs-' in slug:
-        competitor = slug.split('-vs-')[1].replace('-', ' ').title()
+    _, vs, stem = slug.partition('-vs-')
+    competitor = stem.replace('-', ' ').title() if vs else ''
     # Build the long content block.
-    long_content = build_long_content(title, competitor)
-    # Insert long content before the first <footer> tag.
-    if '<footer' in html:
-        html = html.replace('<footer', long_content + '\n<footer', 1)
+    long_content = b'\n'.join((
+        LONG_CONTENT_START,
+        build_long_content(title, competitor).encode('utf-8'),
+        LONG_CONTENT_END,
+    ))
+    # Replace content from an earlier run, else insert the block before
+    # the first <footer> tag.
+    span = find_long_content(html)
+    if span is not None:
+        html = html[:span[0]] + long_content + html[span[1]:]
     else:
-        html += '\n' + long_content
+        footer_at = html.find(b'<footer')
+        if footer_at >= 0:
+            html = html[:footer_at] + long_content + b'\n' + html[footer_at:]
+        else:
+            html += b'\n' + long_content
 
     # Construct a targeted meta description.  If this is a comparison article,
     # mention both WriteSonic and the competitor; otherwise summarise the topic
     # and include high‑value keywords.
     if competitor:
-        description = (
-            f"Detailed comparison of WriteSonic and {competitor}. Explore features, pricing, pros and cons, user "
-            "reviews and SEO insights. Optimised to rank for queries like ‘WriteSonic vs {competitor}’, ‘best AI writer 2025’ "
-            "and related keywords."
-        )
+        description = COMPARISON_DESCRIPTION.format(competitor=competitor)
     else:
-        description = (
-            f"Comprehensive guide to {title}. Includes keyword research, AI writing technology breakdown, pricing, "
-            "SEO best practices and frequently asked questions. Ideal for ranking on ‘best AI writer 2025’, ‘AI content "
-            "generator free’, ‘WriteSonic review’ and similar search queries."
-        )
+        description = GUIDE_DESCRIPTION.format(title=title)
     # Update existing meta description if present, else insert a new one after <title>.
-    if 'meta name="description"' in html:
-        html = re.sub(r'<meta name="description" content="[^"]*"',
-                      f'<meta name="description" content="{description}"', html, count=1)
+    if b'meta name="description"' in html:
+        meta = f'<meta name="description" content="{description}"'.encode('utf-8')
+        meta_at = html.find(b'<meta name="description" content="')
+        if meta_at >= 0 and not html.startswith(meta, meta_at):
+            # Splice over the old content attribute up to its closing quote.
+            content_end = html.find(b'"', meta_at + len(b'<meta name="description" content="'))
+            if content_end >= 0:
+                html = html[:meta_at] + meta + html[content_end + 1:]
     else:
         # Insert meta tag after </title>
-        html = html.replace('</title>', f'</title>\n    <meta name="description" content="{description}" />', 1)
+        title_end = html.find(b'</title>')
+        if title_end >= 0:
+            title_end += len(b'</title>')
+            meta = f'\n    <meta name="description" content="{description}" />'.encode('utf-8')
+            html = html[:title_end] + meta + html[title_end:]
+    return html
+
+
+def update_post(file_path: str, slug: str) -> None:
+    """Read an HTML file, update its hero image based on the slug and
+    append long content before the footer to meet the 2,500 word target.
+
+    The hero image is checked on every run, so new IMAGES_MAP entries reach
+    posts that were already updated.  Posts already carrying the current
+    LONG_CONTENT_START comment skip the long content and meta description,
+    and the file is only rewritten when something changed.
+
+    Args:
+        file_path: Path to the HTML file.
+        slug: Slug of the article (filename without extension).
+    """
+    # Read and rewrite through one handle rather than reopening the file.
+    # The HTML stays as UTF-8 bytes; only the title and the inserted text
+    # go through the codec.
+    with open(file_path, 'rb+') as f:
+        html = original = f.read()
+        # Determine new image src.
+        image_src = IMAGE_SRCS.get(slug, DEFAULT_IMAGE_SRC)
+        # Replace only the first occurrence of the hero image src attribute,
+        # leaving it alone when it already points at the right image.
+        src_at = html.find(b'src="/images/')
+        if src_at >= 0 and not html.startswith(image_src, src_at):
+            src_end = html.find(b'"', src_at + len(b'src="/images/'))
+            if src_end >= 0:
+                html = html[:src_at] + image_src + html[src_end + 1:]
+        # Posts already updated with the current content only needed the
+        # image check above.
+        marker_at = html.find(UPDATED_MARKER_PREFIX)
+        if marker_at < 0 or not html.startswith(LONG_CONTENT_START, marker_at):
+            html = add_long_content(html, slug)
+        if html is original:
+            return
 
-    # Write the updated HTML back to file.
-    with open(file_path, 'w', encoding='utf-8') as f:
+        # Write the updated HTML back over the original contents.
+        f.seek(0)
         f.write(html)
+        f.truncate()
 
 
 def main() -> None:
     posts_dir = os.path.join('affiliate-website', 'posts')
-    for filename in os.listdir(posts_dir):
-        if not filename.endswith('.html'):
-            continue
-        slug = filename[:-5]
-        update_post(os.path.join(posts_dir, filename), slug)
+    # Posts are updated one after another: each takes well under a
+    # millisecond, so worker start-up would cost more than the work.
+    # DirEntry.path is already joined, so no path is built per file.
+    with os.scandir(posts_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.html'):
+                update_post(entry.path, entry.name[:-5])
 
 
 if __name__ == '__main__':